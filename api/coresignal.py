@@ -1,26 +1,120 @@
 """Coresignal API client for searching employee profiles"""
 
+import asyncio
+import functools
+import hashlib
 import httpx
-from typing import Optional, Dict, List
+import orjson
+from cachetools import LRUCache
+from typing import Optional, Dict, List, Tuple
 from datetime import datetime
 import os
+from operator import itemgetter
+
+__all__ = ["CoreSignalClient"]
+
+# Profile fields checked, in priority order, for the LinkedIn and photo URLs
+_LINKEDIN_KEYS = ("profile_url", "linkedin_url", "url")
+_PHOTO_KEYS = (
+    "profile_image_url",
+    "profile_picture_url",
+    "picture_url",
+    "avatar",
+    "photo_url",
+    "image_url",
+    "picture"
+)
+
+# English month abbreviations indexed by month number, independent of locale
+_MONTH_ABBR = ("", "Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+_URL_SCHEMES = ("http://", "https://")
+_HTTPS_PREFIX = "https://"
+
+
+def _normalize_url(url: str) -> str:
+    """Ensure a URL carries a protocol, defaulting to https."""
+    return url if url.startswith(_URL_SCHEMES) else _HTTPS_PREFIX + url.lstrip("/")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_string(value: str) -> Optional[datetime]:
+    """Parse a date string into a datetime; results are memoized."""
+    clean_value = value.strip()
+    # Remove trailing Z if present
+    if clean_value.endswith("Z"):
+        clean_value = clean_value[:-1]
+
+    # Fast path for the dominant YYYY, YYYY-MM and YYYY-MM-DD shapes:
+    # convert the fields directly instead of going through strptime.
+    # Anything longer (times, offsets) is left to fromisoformat.
+    parts = clean_value.split("-")
+    if len(clean_value) <= 10 and len(parts) <= 3 and len(parts[0]) == 4:
+        try:
+            year = int(parts[0])
+            month = int(parts[1]) if len(parts) > 1 else 1
+            day = int(parts[2]) if len(parts) > 2 else 1
+            return datetime(year, month, day)
+        except ValueError:
+            return None
+
+    try:
+        return datetime.fromisoformat(clean_value)
+    except ValueError:
+        return None
 
 
 class CoreSignalClient:
     """Client for interacting with Coresignal Employee API"""
 
     BASE_URL = "https://api.coresignal.com/cdapi"
+    MAX_COLLECT_CONCURRENCY = 8
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize the Coresignal client
 
         Args:
             api_key: Coresignal API key. If not provided, reads from environment.
+            http_client: Shared AsyncClient to reuse pooled connections.
+                If not provided, a dedicated client is created.
         """
         self.api_key = api_key or os.getenv("CORESIGNAL_API_KEY")
         if not self.api_key:
             raise ValueError("Coresignal API key is required")
+        self.http = http_client or httpx.AsyncClient(timeout=60.0)
+
+        # Cap concurrent collect requests across all searches on this client.
+        # The semaphore is created lazily so it binds to the running event loop.
+        self.max_collect_concurrency = self._read_max_concurrency()
+        self._collect_sem: Optional[asyncio.Semaphore] = None
+
+        # Recently extracted profiles, keyed by their raw payload
+        self._extract_cache = LRUCache(maxsize=256)
+
+    def _read_max_concurrency(self) -> int:
+        """
+        Read CORESIGNAL_MAX_CONCURRENCY, falling back to MAX_COLLECT_CONCURRENCY.
+        A cap below 1 would block every collect request, so it is rejected.
+        """
+        raw_value = os.getenv("CORESIGNAL_MAX_CONCURRENCY")
+        if raw_value is None or not raw_value.strip():
+            return self.MAX_COLLECT_CONCURRENCY
+
+        try:
+            value = int(raw_value)
+        except ValueError:
+            raise ValueError(
+                f"CORESIGNAL_MAX_CONCURRENCY must be an integer >= 1, got {raw_value!r}"
+            ) from None
+
+        if value < 1:
+            raise ValueError(f"CORESIGNAL_MAX_CONCURRENCY must be >= 1, got {value}")
+        return value
 
     async def search_person(
         self,
@@ -38,7 +132,8 @@ class CoreSignalClient:
             limit: Maximum number of results to return (default: 10)
 
         Returns:
-            Dict containing search results from Coresignal API
+            Dict containing search results from Coresignal API, with "partial"
+            set when a search fallback or any profile collect failed
 
         Raises:
             httpx.HTTPError: If the API request fails
@@ -49,58 +144,69 @@ class CoreSignalClient:
             if not name:
                 return {"results": []}
 
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                # Step 1: Search for employee IDs using full name first, then fallbacks
-                search_payloads = self._build_search_payloads(name, company)
-                employee_ids = []
-                last_error = None
+            client = self.http
+            # Step 1: Search for employee IDs using full name first, then fallbacks
+            search_payloads = self._build_search_payloads(name, company)
+            employee_ids = []
+            last_error = None
 
-                for payload in search_payloads:
-                    try:
-                        employee_ids = await self._search_employee_ids(client, payload)
-                        if employee_ids:
-                            break
-                    except httpx.HTTPError as e:
-                        # Keep the last error to bubble up if all attempts fail
-                        last_error = e
-                        continue
+            for payload in search_payloads:
+                try:
+                    employee_ids = await self._search_employee_ids(client, payload)
+                    if employee_ids:
+                        break
+                except httpx.HTTPError as e:
+                    # Keep the last error to bubble up if all attempts fail
+                    last_error = e
+                    continue
 
-                if not employee_ids:
-                    if last_error:
-                        raise last_error
-                    return {"results": []}
+            if not employee_ids:
+                if last_error:
+                    raise last_error
+                return {"results": []}
 
-                # Limit the number of IDs to collect
-                employee_ids = employee_ids[:limit]
+            # Limit the number of IDs to collect
+            employee_ids = employee_ids[:limit]
+            # A failed earlier payload means a better match may have been missed
+            partial = last_error is not None
 
-                # Step 2: Collect full profiles for each ID
-                results = []
-                collect_headers = {
-                    "apikey": self.api_key,
-                    "accept": "application/json"
-                }
+            # Step 2: Collect full profiles for each ID concurrently
+            collect_headers = {
+                "apikey": self.api_key,
+                "accept": "application/json"
+            }
 
-                for employee_id in employee_ids:
-                    collect_endpoint = f"{self.BASE_URL}/v2/employee_base/collect/{employee_id}"
-                    try:
+            # Bound the fan-out so large limits don't trip CoreSignal rate limits
+            if self._collect_sem is None:
+                self._collect_sem = asyncio.Semaphore(self.max_collect_concurrency)
+            collect_sem = self._collect_sem
+
+            async def collect(employee_id) -> Optional[Dict]:
+                collect_endpoint = f"{self.BASE_URL}/v2/employee_base/collect/{employee_id}"
+                try:
+                    async with collect_sem:
                         collect_response = await client.get(
                             collect_endpoint,
                             headers=collect_headers
                         )
-                        collect_response.raise_for_status()
-                        profile_data = collect_response.json()
-                        results.append(profile_data)
-                    except Exception as e:
-                        # Skip failed individual requests
-                        continue
+                    collect_response.raise_for_status()
+                    return orjson.loads(collect_response.content)
+                except (httpx.HTTPError, ValueError):
+                    # Skip profiles that fail after transport retries or return bad JSON
+                    return None
 
-                return {"results": results}
+            # Issue all collect requests together; gather preserves ID order
+            gathered = await asyncio.gather(*(collect(eid) for eid in employee_ids))
+            results = [profile_data for profile_data in gathered if profile_data is not None]
+            partial = partial or len(results) < len(gathered)
+
+            return {"results": results, "partial": partial}
 
         except httpx.HTTPError as e:
             error_detail = str(e)
             if hasattr(e, "response") and e.response is not None:
                 try:
-                    error_body = e.response.json()
+                    error_body = orjson.loads(e.response.content)
                     error_detail = f"{str(e)} - Response: {error_body}"
                 except:
                     error_detail = f"{str(e)} - Response text: {e.response.text}"
@@ -118,18 +224,37 @@ class CoreSignalClient:
             raw_data: Raw response from Coresignal API
 
         Returns:
-            List of formatted profile dictionaries
+            List of formatted profile dictionaries. The list may be shared
+            with later calls for the same payload, so callers must not mutate it.
         """
         if "error" in raw_data:
             return []
 
-        profiles = []
         results = raw_data.get("results", [])
 
+        # Key on a digest of the canonical payload plus the current month, since
+        # open-ended ("Present") roles count experience up to now; the digest
+        # keeps full raw payloads from being pinned in the cache
+        now = datetime.utcnow()
+        payload = orjson.dumps(results, option=orjson.OPT_SORT_KEYS)
+        cache_key = (
+            now.year * 12 + now.month - 1,
+            hashlib.blake2b(payload, digest_size=16).digest()
+        )
+        profiles = self._extract_cache.get(cache_key)
+        if profiles is None:
+            profiles = self._extract_results(results)
+            self._extract_cache[cache_key] = profiles
+
+        return profiles
+
+    def _extract_results(self, results: List[Dict]) -> List[Dict]:
+        """Build the profile dictionaries for a list of raw CoreSignal results."""
+        profiles = []
+
         for result in results:
             # Extract current company from experience
             current_company = "N/A"
-            experience_months = 0
             experience = result.get("experience", [])
             experience_entries = experience if isinstance(experience, list) else []
 
@@ -138,27 +263,34 @@ class CoreSignalClient:
                 latest_exp = experience_entries[0]
                 current_company = latest_exp.get("company_name", "N/A")
 
-                # Calculate total experience months using available date ranges
-                experience_months = self._compute_experience_months(experience_entries)
+            # Total months and UI positions from a single pass over the entries
+            experience_months, positions = self._process_experiences(experience_entries)
 
             # Extract skills
             skills_list = []
             skills_data = result.get("skills", [])
             if isinstance(skills_data, list):
-                skills_list = [skill.get("name", skill) if isinstance(skill, dict) else str(skill) for skill in skills_data]
+                try:
+                    # Skills are almost always dicts; skip per-item type checks
+                    skills_list = [skill.get("name", skill) for skill in skills_data]
+                except AttributeError:
+                    skills_list = [skill.get("name", skill) if isinstance(skill, dict) else str(skill) for skill in skills_data]
 
             # Extract education
             education_list = []
             education_data = result.get("education", [])
             if isinstance(education_data, list):
                 for edu in education_data:
-                    if isinstance(edu, dict):
+                    try:
                         school = edu.get("school", "")
                         degree = edu.get("degree", "")
-                        if school or degree:
-                            education_list.append({"school": school, "degree": degree})
-                    elif isinstance(edu, str):
-                        education_list.append({"school": edu, "degree": ""})
+                    except AttributeError:
+                        # Plain-string entries are school names; anything else is skipped
+                        if isinstance(edu, str):
+                            education_list.append({"school": edu, "degree": ""})
+                        continue
+                    if school or degree:
+                        education_list.append({"school": school, "degree": degree})
 
             raw_summary = result.get("summary") or result.get("about") or ""
             summary = raw_summary.strip() if isinstance(raw_summary, str) else ""
@@ -174,7 +306,7 @@ class CoreSignalClient:
                 "education": education_list,
                 "linkedin_url": self._extract_linkedin_url(result),
                 "summary": summary,
-                "positions": self._format_positions(experience_entries),
+                "positions": positions,
                 "photo_url": self._extract_photo_url(result),
                 "source": ""
             }
@@ -212,7 +344,7 @@ class CoreSignalClient:
         }
 
         def parse_ids(resp: httpx.Response) -> List[str]:
-            ids_json = resp.json()
+            ids_json = orjson.loads(resp.content)
             if not isinstance(ids_json, list):
                 return []
             return ids_json
@@ -254,73 +386,30 @@ class CoreSignalClient:
         Extract and normalize the LinkedIn URL from possible fields.
         Ensures a usable link even if protocol is missing.
         """
-        url = profile.get("profile_url") or profile.get("linkedin_url") or profile.get("url") or ""
-
-        if url and not url.startswith("http"):
-            url = f"https://{url.lstrip('/')}"
-
-        return url
+        url = next((profile[key] for key in _LINKEDIN_KEYS if profile.get(key)), "")
+        return _normalize_url(url) if url else url
 
     def _extract_photo_url(self, profile: Dict) -> str:
         """
         Try common keys for a profile photo/logo URL.
         """
-        possible_keys = [
-            "profile_image_url",
-            "profile_picture_url",
-            "picture_url",
-            "avatar",
-            "photo_url",
-            "image_url",
-            "picture"
-        ]
-
-        for key in possible_keys:
+        for key in _PHOTO_KEYS:
             url = profile.get(key)
             if url:
                 if isinstance(url, dict):
                     url = url.get("url") or url.get("src")
                 if isinstance(url, str) and url.strip():
-                    if not url.startswith("http"):
-                        url = f"https://{url.lstrip('/')}"
-                    return url
+                    return _normalize_url(url)
 
         return ""
 
-    def _compute_experience_months(self, experiences: List[Dict]) -> int:
+    def _process_experiences(self, experiences: List[Dict]) -> Tuple[int, List[Dict]]:
         """
-        Calculate total experience duration in months from date ranges.
-        Uses a month-precision timeline to avoid double-counting overlapping roles.
+        Walk experience entries once, returning total months and UI positions.
+        Each entry's dates are parsed a single time and shared by both outputs.
         """
-        month_spans = set()
-
-        for exp in experiences:
-            if not isinstance(exp, dict):
-                continue
-
-            start = self._parse_date(exp.get("date_from"))
-            end = self._parse_date(exp.get("date_to")) or datetime.utcnow()
-
-            if not start or end < start:
-                continue
-
-            # Normalize to first of month for counting
-            current = datetime(start.year, start.month, 1)
-            end_month = datetime(end.year, end.month, 1)
-
-            while current <= end_month:
-                month_spans.add((current.year, current.month))
-                # increment month
-                year, month = current.year, current.month + 1
-                if month > 12:
-                    month = 1
-                    year += 1
-                current = datetime(year, month, 1)
-
-        return len(month_spans)
-
-    def _format_positions(self, experiences: List[Dict]) -> List[Dict]:
-        """Format experience entries into a LinkedIn-style list for the UI."""
+        now = datetime.utcnow()
+        intervals = []
         positions = []
         seen_keys = set()
 
@@ -328,24 +417,31 @@ class CoreSignalClient:
             if not isinstance(exp, dict):
                 continue
 
+            date_to_val = exp.get("date_to")
+            start_dt = self._parse_date(exp.get("date_from"))
+            end_dt = self._parse_date(date_to_val)
+
+            # Month-index interval for the experience total
+            end = end_dt or now
+            if start_dt and end >= start_dt:
+                # Inclusive month indices, e.g. Jan 2020 -> 2020 * 12 + 0
+                intervals.append((
+                    start_dt.year * 12 + start_dt.month - 1,
+                    end.year * 12 + end.month - 1
+                ))
+
             title = exp.get("title") or exp.get("position") or "Role"
             company = exp.get("company_name") or exp.get("company") or ""
-            date_to_val = exp.get("date_to")
             is_current = (
                 exp.get("current") is True
                 or date_to_val in (None, "", "Present")
                 or (isinstance(date_to_val, str) and date_to_val.lower() == "present")
             )
-            start_dt = self._parse_date(exp.get("date_from"))
-            end_dt = self._parse_date(date_to_val)
-            period = self._format_date_range(exp.get("date_from"), date_to_val, is_current)
+            period = self._format_date_range(start_dt, end_dt, is_current)
 
-            # Deduplicate identical roles by title/company/period triple
-            dedupe_key = (
-                (title or "").strip().lower(),
-                (company or "").strip().lower(),
-                (period or "").strip().lower()
-            )
+            # Deduplicate identical roles by title/company/period, joined into one
+            # NUL-separated string (title and company are always str here)
+            dedupe_key = f"{title.strip()}\x00{company.strip()}\x00{period.strip()}".lower()
             if dedupe_key in seen_keys:
                 continue
             seen_keys.add(dedupe_key)
@@ -356,22 +452,51 @@ class CoreSignalClient:
                 "period": period,
                 "location": exp.get("location") or "",
                 "description": exp.get("description") or "",
-                "_start_dt": start_dt
+                # Integer day ordinal compares faster than datetimes; undated roles sort last
+                "_sort_key": start_dt.toordinal() if start_dt else -1
             })
 
         # Sort positions by start date descending (most recent first)
-        positions.sort(key=lambda p: p.get("_start_dt") or datetime.min, reverse=True)
+        positions.sort(key=itemgetter("_sort_key"), reverse=True)
 
         # Remove helper field before returning
         for pos in positions:
-            pos.pop("_start_dt", None)
+            del pos["_sort_key"]
+
+        return self._sum_month_intervals(intervals), positions
+
+    def _sum_month_intervals(self, intervals: List[Tuple[int, int]]) -> int:
+        """
+        Total the months covered by inclusive month-index intervals.
+        Merges overlapping or adjacent ranges to avoid double-counting roles.
+        """
+        if not intervals:
+            return 0
 
-        return positions
+        intervals.sort()
+        total = 0
+        cur_start, cur_end = intervals[0]
 
-    def _format_date_range(self, date_from: Optional[str], date_to: Optional[str], is_current: bool = False) -> str:
+        for next_start, next_end in intervals[1:]:
+            if next_start <= cur_end + 1:
+                # Overlapping or adjacent range: extend the current span
+                cur_end = max(cur_end, next_end)
+            else:
+                total += cur_end - cur_start + 1
+                cur_start, cur_end = next_start, next_end
+
+        total += cur_end - cur_start + 1
+        return total
+
+    def _format_date_range(
+        self,
+        start_dt: Optional[datetime],
+        end_dt: Optional[datetime],
+        is_current: bool = False
+    ) -> str:
         """Return a human-friendly date range like 'Jan 2020 - Present'."""
-        start_dt = self._parse_date(date_from)
-        end_dt = None if is_current else self._parse_date(date_to)
+        if is_current:
+            end_dt = None
 
         start_str = self._format_month_year(start_dt) if start_dt else ""
         end_str = "Present" if is_current or not end_dt else self._format_month_year(end_dt)
@@ -384,7 +509,7 @@ class CoreSignalClient:
         """Format a datetime as 'Mon YYYY'."""
         if not dt:
             return ""
-        return dt.strftime("%b %Y")
+        return f"{_MONTH_ABBR[dt.month]} {dt.year}"
 
     def _parse_date(self, date_value: Optional[str]) -> Optional[datetime]:
         """Parse various date string formats into a datetime object."""
@@ -395,20 +520,6 @@ class CoreSignalClient:
             return date_value
 
         if isinstance(date_value, str):
-            clean_value = date_value.strip()
-            # Remove trailing Z if present
-            if clean_value.endswith("Z"):
-                clean_value = clean_value[:-1]
-
-            for fmt in ("%Y-%m-%d", "%Y-%m", "%Y"):
-                try:
-                    return datetime.strptime(clean_value, fmt)
-                except ValueError:
-                    continue
-
-            try:
-                return datetime.fromisoformat(clean_value)
-            except ValueError:
-                return None
+            return _parse_date_string(date_value)
 
         return None
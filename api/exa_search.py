@@ -4,29 +4,41 @@ import os
 from typing import Dict, List, Optional
 
 import httpx
+import orjson
+
+__all__ = ["ExaSearchClient"]
 
 
 class ExaSearchClient:
     """Lightweight client for the Exa Search API."""
 
     BASE_URL = "https://api.exa.ai"
+    TIMEOUT = 30.0
 
-    def __init__(self, api_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None
+    ) -> None:
         """
         Initialize the Exa client.
 
         Args:
             api_key: Exa API key. If not provided, reads from environment.
+            http_client: Shared AsyncClient to reuse pooled connections.
+                If not provided, a dedicated client is created.
         """
         self.api_key = api_key or os.getenv("EXA_API_KEY")
         if not self.api_key:
             raise ValueError("Exa API key is required")
+        self.http = http_client or httpx.AsyncClient(timeout=self.TIMEOUT)
 
     async def search_profiles(
         self,
         name: str,
         company: Optional[str] = None,
-        limit: int = 5
+        limit: int = 5,
+        raise_errors: bool = False
     ) -> List[Dict]:
         """
         Search for likely LinkedIn profile URLs using Exa.
@@ -35,6 +47,7 @@ class ExaSearchClient:
             name: Person's name to search for.
             company: Optional company to refine the query.
             limit: Max number of results to return.
+            raise_errors: Re-raise request failures instead of returning [].
 
         Returns:
             Normalized list of profile dictionaries compatible with the UI.
@@ -57,16 +70,18 @@ class ExaSearchClient:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{self.BASE_URL}/search",
-                    headers=headers,
-                    json=payload
-                )
-                response.raise_for_status()
-                data = response.json()
-                results = data.get("results", [])
+            response = await self.http.post(
+                f"{self.BASE_URL}/search",
+                headers=headers,
+                json=payload,
+                timeout=self.TIMEOUT
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            results = data.get("results", [])
         except Exception:
+            if raise_errors:
+                raise
             return []
 
         return self._normalize_results(results, name)
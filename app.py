@@ -1,22 +1,69 @@
 """FastAPI application for people parsing and search"""
 
+from contextlib import asynccontextmanager
+
+import httpx
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from pydantic import BaseModel
-from typing import Optional
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+import asyncio
 import os
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
 from api.coresignal import CoreSignalClient
 from api.exa_search import ExaSearchClient
-from utils.formatter import format_experience, format_skills, format_education
+from utils.formatter import format_profiles_batch
 
 # Load environment variables
 load_dotenv()
 
-app = FastAPI(title="People Parser", description="Search for people using CoreSignal API")
+
+def _build_client(client_cls, key_env: str, http_client: httpx.AsyncClient):
+    """
+    Instantiate an API client, returning None if its API key is not configured.
+    Any other construction error (e.g. invalid settings) propagates and fails startup.
+    """
+    if not os.getenv(key_env):
+        return None
+    return client_cls(http_client=http_client)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create one pooled HTTP/2 client for the process and close it on shutdown"""
+    # The transport owns pooling and retries failed connection attempts,
+    # so the API clients don't need their own retry loops for those
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(
+            max_keepalive_connections=50,
+            max_connections=100,
+            keepalive_expiry=60
+        )
+    )
+    app.state.http = httpx.AsyncClient(transport=transport, timeout=60.0)
+
+    try:
+        # API clients are stateless apart from the shared HTTP client, so build them
+        # once; a missing key leaves the provider unset, bad settings fail startup
+        app.state.cs = _build_client(CoreSignalClient, "CORESIGNAL_API_KEY", app.state.http)
+        app.state.exa = _build_client(ExaSearchClient, "EXA_API_KEY", app.state.http)
+        yield
+    finally:
+        await app.state.http.aclose()
+
+
+app = FastAPI(
+    title="People Parser",
+    description="Search for people using CoreSignal API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
 
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -24,6 +71,11 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 # Setup templates
 templates = Jinja2Templates(directory="templates")
 
+# Cache formatted search results keyed by the normalized query
+SEARCH_CACHE_TTL = 300
+_search_cache = TTLCache(maxsize=1024, ttl=SEARCH_CACHE_TTL)
+_search_inflight: Dict[Tuple, "asyncio.Future[Tuple[Dict, bool]]"] = {}
+
 
 class SearchRequest(BaseModel):
     """Request model for person search"""
@@ -40,99 +92,181 @@ async def read_root(request: Request):
 
 
 @app.post("/api/search")
-async def search_person(search_request: SearchRequest):
+async def search_person(search_request: SearchRequest, request: Request):
     """
     Search for a person using CoreSignal API
 
     Args:
         search_request: SearchRequest with name, optional company, and limit
+        request: Incoming request, used to reach the shared API clients
 
     Returns:
         Formatted search results
     """
     try:
-        # Initialize CoreSignal client
-        client = CoreSignalClient()
-        use_exa = search_request.use_exa and bool(os.getenv("EXA_API_KEY"))
-        exa_profiles = []
+        cs_client = request.app.state.cs
+        if cs_client is None:
+            raise ValueError("Coresignal API key is required")
+        exa_client = request.app.state.exa if search_request.use_exa else None
 
-        # Search for person
-        raw_results = await client.search_person(
+        cache_key = (
+            search_request.name.strip().lower(),
+            (search_request.company or "").strip().lower(),
+            search_request.limit,
+            exa_client is not None
+        )
+        result, complete = await _cached_search(
+            cache_key,
+            lambda: _run_search(search_request, cs_client, exa_client)
+        )
+        # Only let clients cache results that weren't degraded by upstream failures
+        headers = {"Cache-Control": f"public, max-age={SEARCH_CACHE_TTL}"} if complete else None
+        # Return the response directly so FastAPI skips its jsonable_encoder pass
+        return ORJSONResponse(result, headers=headers)
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
+
+
+async def _cached_search(
+    key: Tuple,
+    compute: Callable[[], Awaitable[Tuple[Dict, bool]]]
+) -> Tuple[Dict, bool]:
+    """
+    Return a search result and whether it is complete, computing it at most
+    once per key. Concurrent requests for the same key share the in-flight
+    search's outcome (result or exception) instead of issuing duplicate
+    upstream calls. Only complete results are cached, so later requests
+    search again after a partial one.
+    """
+    while True:
+        # No await between the lookups and registration, so this is atomic on the event loop
+        cached = _search_cache.get(key)
+        if cached is not None:
+            return cached, True
+
+        future = _search_inflight.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            _search_inflight[key] = future
+            break
+
+        # Another request is already searching; shield it from our own cancellation
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            # The searching request was cancelled; retry and take over
+
+    try:
+        outcome = await compute()
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except BaseException as e:
+        future.set_exception(e)
+        # Mark it retrieved so a search with no waiters doesn't log a warning
+        future.exception()
+        raise
+    else:
+        future.set_result(outcome)
+        result, complete = outcome
+        if complete:
+            _search_cache[key] = result
+        return outcome
+    finally:
+        del _search_inflight[key]
+
+
+async def _run_search(
+    search_request: SearchRequest,
+    client: CoreSignalClient,
+    exa_client: Optional[ExaSearchClient]
+) -> Tuple[Dict, bool]:
+    """
+    Query CoreSignal (and optionally Exa) and format the combined profiles
+
+    Args:
+        search_request: SearchRequest with name, optional company, and limit
+        client: Shared CoreSignal client
+        exa_client: Shared Exa client, or None to skip Exa enrichment
+
+    Returns:
+        Formatted search results, and False if any upstream call failed
+    """
+    # Query CoreSignal and (optionally) Exa concurrently over the shared client
+    searches = [
+        client.search_person(
             name=search_request.name,
             company=search_request.company,
             limit=search_request.limit
         )
-
-        # Check for errors in the response
-        if "error" in raw_results:
-            raise HTTPException(
-                status_code=raw_results.get("status_code", 500),
-                detail=raw_results["error"]
+    ]
+    if exa_client is not None:
+        searches.append(
+            exa_client.search_profiles(
+                name=search_request.name,
+                company=search_request.company,
+                limit=search_request.limit,
+                raise_errors=True
             )
+        )
 
-        # Extract profiles
-        profiles = client.extract_profiles(raw_results)
-
-        # Try to enrich with Exa search results (best-effort)
-        if use_exa:
-            try:
-                exa_client = ExaSearchClient()
-                exa_profiles = await exa_client.search_profiles(
-                    name=search_request.name,
-                    company=search_request.company,
-                    limit=search_request.limit
-                )
-            except Exception:
-                # Exa is optional; ignore failures
-                exa_profiles = []
-
-        # Combine and de-duplicate by LinkedIn URL
-        seen_urls = set()
-        combined_profiles = []
-
-        for profile in profiles:
-            url_key = (profile.get("linkedin_url") or "").lower()
-            if url_key:
-                seen_urls.add(url_key)
-            combined_profiles.append(profile)
-
-        for profile in exa_profiles:
-            url_key = (profile.get("linkedin_url") or "").lower()
-            if url_key and url_key in seen_urls:
-                continue
-            if url_key:
-                seen_urls.add(url_key)
-            combined_profiles.append(profile)
-
-        # Format profiles for display
-        formatted_profiles = []
-        for profile in combined_profiles:
-            formatted_profile = {
-                "name": profile["name"],
-                "title": profile["title"],
-                "company": profile["company"],
-                "location": profile["location"],
-                "experience": format_experience(profile["experience_months"]),
-                "summary": profile.get("summary", ""),
-                "positions": profile.get("positions", []),
-                "skills": format_skills(profile["skills"]),
-                "education": format_education(profile["education"]),
-                "linkedin_url": profile["linkedin_url"],
-                "photo_url": profile.get("photo_url", ""),
-                "source": profile["source"]
-            }
-            formatted_profiles.append(formatted_profile)
-
-        return {
-            "success": True,
-            "count": len(formatted_profiles),
-            "results": formatted_profiles
-        }
+    raw_results, *exa_outcome = await asyncio.gather(*searches, return_exceptions=True)
 
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
+    # CoreSignal is required; surface its failures
+    if isinstance(raw_results, BaseException):
+        raise raw_results
+
+    # Check for errors in the response
+    if "error" in raw_results:
+        raise HTTPException(
+            status_code=raw_results.get("status_code", 500),
+            detail=raw_results["error"]
+        )
+
+    # Extract profiles
+    profiles = client.extract_profiles(raw_results)
+
+    complete = not raw_results.get("partial", False)
+
+    # Exa is optional and best-effort; a failure only marks the result partial
+    exa_profiles = []
+    if exa_outcome:
+        if isinstance(exa_outcome[0], BaseException):
+            complete = False
+        else:
+            exa_profiles = exa_outcome[0]
+
+    # Combine and de-duplicate by LinkedIn URL
+    seen_urls = set()
+    combined_profiles = []
+
+    for profile in profiles:
+        url_key = (profile.get("linkedin_url") or "").lower()
+        if url_key:
+            seen_urls.add(url_key)
+        combined_profiles.append(profile)
+
+    for profile in exa_profiles:
+        url_key = (profile.get("linkedin_url") or "").lower()
+        if url_key and url_key in seen_urls:
+            continue
+        if url_key:
+            seen_urls.add(url_key)
+        combined_profiles.append(profile)
+
+    # Format profiles for display
+    formatted_profiles = format_profiles_batch(combined_profiles)
+
+    return {
+        "success": True,
+        "count": len(formatted_profiles),
+        "results": formatted_profiles
+    }, complete
 
 
 @app.get("/api/health")
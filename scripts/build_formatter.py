@@ -0,0 +1,33 @@
+"""Compile utils/formatter.py to a C extension with mypyc
+
+Usage:
+    pip install mypy
+    python scripts/build_formatter.py
+
+This is a build helper only, not the project's install manifest. The app runs
+unchanged without it; once built, Python imports the compiled module (the
+utils/formatter*.so files) instead of utils/formatter.py. Delete them to go
+back to pure Python.
+"""
+
+import os
+import sys
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main() -> None:
+    # Build in place from the repo root so the extension lands next to utils/formatter.py
+    os.chdir(ROOT)
+    setup(
+        name="people-parse-formatter",
+        ext_modules=mypycify(["utils/formatter.py"]),
+        script_args=sys.argv[1:] or ["build_ext", "--inplace"],
+    )
+
+
+if __name__ == "__main__":
+    main()
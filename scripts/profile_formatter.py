@@ -0,0 +1,94 @@
+"""Profile utils/formatter.py against a synthetic profile dataset
+
+Usage:
+    python scripts/profile_formatter.py [--profiles 10000] [--output formatter.pstats]
+
+With --output, the raw stats can be rendered as a call graph:
+    gprof2dot -f pstats formatter.pstats | dot -Tpng -o formatter.png
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import random
+import sys
+from typing import Dict, List
+
+# Allow running from the repo root without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.formatter import (  # noqa: E402
+    format_education,
+    format_experience,
+    format_profiles_batch,
+    format_skills
+)
+
+SKILLS = ["Python", "SQL", "Go", "React", "Kubernetes", "Figma", "Sales", "Finance", "Rust", "Excel"]
+SCHOOLS = ["MIT", "Stanford University", "UC Berkeley", "Georgia Tech", ""]
+DEGREES = ["BS Computer Science", "MBA", "PhD", "BA Economics", ""]
+
+
+def load_sample_profiles(count: int, seed: int = 0) -> List[Dict]:
+    """Build extracted-profile dicts shaped like CoreSignalClient.extract_profiles output"""
+    rng = random.Random(seed)
+    profiles = []
+
+    for i in range(count):
+        education = [
+            {"school": rng.choice(SCHOOLS), "degree": rng.choice(DEGREES)}
+            for _ in range(rng.randint(0, 3))
+        ]
+        if rng.random() < 0.1:
+            education.append(rng.choice(SCHOOLS) or "Self-taught")
+
+        profiles.append({
+            "name": f"Person {i}",
+            "title": "Engineer",
+            "company": "Acme",
+            "location": "San Francisco",
+            "experience_months": rng.randint(0, 480),
+            "summary": "",
+            "positions": [],
+            "skills": rng.sample(SKILLS, rng.randint(0, len(SKILLS))),
+            "education": education,
+            "linkedin_url": f"https://www.linkedin.com/in/person-{i}",
+            "photo_url": "",
+            "source": ""
+        })
+
+    return profiles
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profiles", type=int, default=10_000, help="Number of synthetic profiles")
+    parser.add_argument("--output", help="Write raw pstats here (for gprof2dot)")
+    parser.add_argument("--limit", type=int, default=30, help="Number of stats rows to print")
+    args = parser.parse_args()
+
+    data = load_sample_profiles(args.profiles)
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+    # Individual formatters, the way callers used them before batching
+    for profile in data:
+        format_experience(profile["experience_months"])
+        format_skills(profile["skills"])
+        format_education(profile["education"])
+
+    # Fused pass used by /api/search
+    format_profiles_batch(data)
+
+    profiler.disable()
+
+    if args.output:
+        profiler.dump_stats(args.output)
+
+    pstats.Stats(profiler).sort_stats("cumulative").print_stats(args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,42 @@
 """Utilities for formatting profile data for display"""
 
-from typing import List, Dict
+import sys
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Union, cast
 
+# Singular/plural unit words, indexed by (count != 1)
+_MONTH_WORDS = (sys.intern("month"), sys.intern("months"))
+_YEAR_WORDS = (sys.intern("year"), sys.intern("years"))
 
+# Joins "<degree> from <school>" by concatenation; a "{degree} from {school}"
+# template with str.format_map re-parses the template on every call and is slower
+_FROM = sys.intern(" from ")
+
+# Precomputed decimal strings for the month/year counts seen in practice
+_SMALL_INTS = tuple(str(i) for i in range(1001))
+
+# Shared immutable empty result; an empty tuple is a cached singleton
+_EMPTY: Tuple[str, ...] = ()
+
+
+# Education entries are dicts with "school"/"degree" keys or plain strings
+EducationEntry = Union[Dict[str, Any], str]
+
+# Untyped view of an education list; aliased so List[Any] isn't rebuilt per call
+_UntypedEntries = List[Any]
+
+
+def _int_str(value: int) -> str:
+    """Return the decimal string for value, from the lookup table when in range"""
+    return _SMALL_INTS[value] if 0 <= value < len(_SMALL_INTS) else str(value)
+
+
+@lru_cache(maxsize=2048)
 def format_experience(months: int) -> str:
     """
-    Convert experience in months to human-readable format
+    Convert experience in months to human-readable format.
+    Results are memoized; months must be a hashable int.
 
     Args:
         months: Number of months of experience
@@ -14,38 +45,49 @@ def format_experience(months: int) -> str:
         Formatted string like "2 years 3 months" or "6 months"
     """
     if months < 12:
-        return f"{months} month{'s' if months != 1 else ''}"
+        return " ".join((_int_str(months), _MONTH_WORDS[months != 1]))
 
-    years = months // 12
-    remaining_months = months % 12
+    years, remaining_months = divmod(months, 12)
 
     if remaining_months == 0:
-        return f"{years} year{'s' if years != 1 else ''}"
+        return " ".join((_int_str(years), _YEAR_WORDS[years != 1]))
 
-    return f"{years} year{'s' if years != 1 else ''} {remaining_months} month{'s' if remaining_months != 1 else ''}"
+    return " ".join((
+        _int_str(years),
+        _YEAR_WORDS[years != 1],
+        _SMALL_INTS[remaining_months],
+        _MONTH_WORDS[remaining_months != 1]
+    ))
 
 
-def format_skills(skills: List[str], max_display: int = 5) -> Dict:
+def format_skills(skills: Iterable[str], max_display: int = 5) -> Dict[str, Sequence[str]]:
     """
     Format skills list for display
 
     Args:
-        skills: List of skill strings
+        skills: Skill strings, as a list, tuple or any other iterable
         max_display: Maximum number of skills to show initially
 
     Returns:
-        Dict with 'visible' and 'hidden' skill lists
+        Dict with 'visible' and 'hidden' skill sequences. They may be
+        the input sequence or a shared empty tuple, so callers must not mutate them.
     """
-    if not skills:
-        return {"visible": [], "hidden": []}
+    if isinstance(skills, (list, tuple)):
+        if len(skills) <= max_display:
+            # Nothing to hide (including no skills at all): hand back the input
+            # without copying it
+            return {"visible": skills, "hidden": _EMPTY}
+
+        return {"visible": skills[:max_display], "hidden": skills[max_display:]}
 
-    return {
-        "visible": skills[:max_display],
-        "hidden": skills[max_display:] if len(skills) > max_display else []
-    }
+    # Generators and other iterables can't be sliced; consume them lazily instead
+    remaining = iter(skills)
+    visible = list(islice(remaining, max_display))
+    hidden = list(remaining)
+    return {"visible": visible, "hidden": hidden or _EMPTY}
 
 
-def format_education(education: List[Dict]) -> List[str]:
+def format_education(education: List[EducationEntry]) -> List[str]:
     """
     Format education data for display
 
@@ -55,20 +97,77 @@ def format_education(education: List[Dict]) -> List[str]:
     Returns:
         List of formatted education strings
     """
-    formatted = []
-
-    for edu in education:
-        if isinstance(edu, dict):
-            school = edu.get("school", "")
-            degree = edu.get("degree", "")
+    # Many profiles have no education; skip the loop setup entirely
+    if not education:
+        return []
+
+    formatted: List[str] = []
+    append = formatted.append
+    dict_get = dict.get
+
+    # Entries of any other type are skipped, so iterate untyped: a compiled
+    # build would otherwise reject them before they reach the type checks
+    for edu in cast(_UntypedEntries, education):
+        entry_type = edu.__class__
+        if entry_type is dict:
+            school = dict_get(edu, "school", "")
+            degree = dict_get(edu, "degree", "")
 
             if school and degree:
-                formatted.append(f"{degree} from {school}")
+                append(degree + _FROM + school)
             elif school:
-                formatted.append(school)
+                append(school)
             elif degree:
-                formatted.append(degree)
-        elif isinstance(edu, str):
-            formatted.append(edu)
+                append(degree)
+        elif entry_type is str:
+            append(edu)
+
+    return formatted
+
+
+def format_education_batch(educations: List[List[EducationEntry]]) -> List[List[str]]:
+    """
+    Format the education lists of many profiles in one call
+
+    Args:
+        educations: One education list per profile
+
+    Returns:
+        One list of formatted education strings per profile
+    """
+    return [format_education(education) for education in educations]
+
+
+def format_profiles_batch(profiles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Format extracted profiles for display in a single pass
+
+    Args:
+        profiles: Profile dictionaries as produced by the API clients
+
+    Returns:
+        One display-ready dictionary per profile, in the same order
+    """
+    # Preallocate the result and bind the per-field formatters locally
+    formatted: List[Any] = [None] * len(profiles)
+    fmt_experience = format_experience
+    fmt_skills = format_skills
+    fmt_education = format_education
+
+    for i, profile in enumerate(profiles):
+        formatted[i] = {
+            "name": profile["name"],
+            "title": profile["title"],
+            "company": profile["company"],
+            "location": profile["location"],
+            "experience": fmt_experience(profile["experience_months"]),
+            "summary": profile.get("summary", ""),
+            "positions": profile.get("positions", []),
+            "skills": fmt_skills(profile["skills"]),
+            "education": fmt_education(profile["education"]),
+            "linkedin_url": profile["linkedin_url"],
+            "photo_url": profile.get("photo_url", ""),
+            "source": profile["source"]
+        }
 
     return formatted